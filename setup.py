@@ -14,10 +14,11 @@ setup(
         "boto3",
         "click",
         "GeoAlchemy2",
-        "geopandas",
+        "geopandas>=1.0",
         "numpy",
         "psycopg2-binary",
         "pyarrow",
+        "pyogrio",
         "python-dotenv",
         "rasterio",
         "SQLAlchemy",
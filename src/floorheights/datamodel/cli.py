@@ -1,5 +1,6 @@
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -10,18 +11,28 @@ import numpy as np
 import pandas as pd
 import psycopg2
 import rasterio
+import shapely
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
+from rasterio.warp import transform_bounds
 from shapely.geometry import box
-from sqlalchemy import JSON, UUID, LargeBinary, Numeric, String, Table, select
+from sqlalchemy import (
+    JSON,
+    UUID,
+    MetaData,
+    Numeric,
+    select,
+    union_all,
+)
 from sqlalchemy.dialects.postgresql import NUMRANGE
-from sqlalchemy.exc import OperationalError, IntegrityError
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
 from floorheights.datamodel import etl
 from floorheights.datamodel.models import (
     AddressPoint,
     Building,
+    FloorMeasure,
+    FloorMeasureImage,
     SessionLocal,
 )
 
@@ -34,12 +45,25 @@ def cli():
 @click.command()
 @click.option("-i", "--input-address", required=True, type=click.Path(exists=True, file_okay=True, dir_okay=True), help="Path to address points file.")  # fmt: skip
 @click.option("-c", "--chunksize", type=int, default=None, help="Number of rows in each batch to be written at a time. By default, all rows will be written at once.")  # fmt: skip
-def ingest_address_points(input_address: click.Path, chunksize: int):
+@click.option("--rebuild-index", is_flag=True, help="Drop the spatial index before copying and rebuild it afterwards. Faster for large initial loads.")  # fmt: skip
+def ingest_address_points(
+    input_address: click.Path, chunksize: int, rebuild_index: bool
+):
     """Ingest address points
 
     Takes an input address points file and ingests it into the data model.
     """
     click.secho("Ingesting address points", bold=True)
+
+    # Only keep building and property centroids, filtered by the reader so other
+    # geocodes are never loaded
+    geocode_types = ["BUILDING CENTROID", "PROPERTY CENTROID"]
+    if input_address.endswith(".parquet") or input_address.endswith(".geoparquet"):
+        geocode_filter = {"filters": [("GEOCODE_TYPE", "in", geocode_types)]}
+    else:
+        geocode_types_sql = ", ".join([f"'{t}'" for t in geocode_types])
+        geocode_filter = {"where": f"GEOCODE_TYPE IN ({geocode_types_sql})"}
+
     try:
         click.echo("Loading address points...")
         address = etl.read_ogr_file(
@@ -50,14 +74,11 @@ def ingest_address_points(input_address: click.Path, chunksize: int):
                 "GEOCODE_TYPE",
                 "PRIMARY_SECONDARY",
             ],
+            **geocode_filter,
         )
     except Exception as error:
         raise click.exceptions.FileError(input_address, error)
 
-    address = address[
-        (address.GEOCODE_TYPE == "BUILDING CENTROID")
-        | (address.GEOCODE_TYPE == "PROPERTY CENTROID")
-    ]
     address = address.rename(
         columns={
             "COMPLETE_ADDRESS": "address",
@@ -70,22 +91,20 @@ def ingest_address_points(input_address: click.Path, chunksize: int):
 
     # Generate UUIDs based on the GNAF IDs
     click.echo("Generating UUIDs...")
-    address["id"] = address["gnaf_id"].apply(etl.generate_uuid)
+    address["id"] = etl.generate_uuids(address["gnaf_id"])
     address = address.set_index("id")
 
     click.echo("Copying to PostgreSQL...")
     session = SessionLocal()
     with session.begin():
-        conn = session.connection()
-        address.to_postgis(
-            "address_point",
-            conn,
-            schema="public",
-            if_exists="append",
-            index=True,
-            chunksize=chunksize,
-            dtype={"id": UUID},
-        )
+        if rebuild_index:
+            etl.drop_spatial_index(session, "address_point", "location")
+
+        etl.copy_geodataframe(session, address, AddressPoint.__table__, chunksize)
+
+        if rebuild_index:
+            click.echo("Rebuilding spatial index...")
+            etl.create_spatial_index(session, "address_point", "location")
         click.echo("Address ingestion complete")
 
 
@@ -98,6 +117,7 @@ def ingest_address_points(input_address: click.Path, chunksize: int):
 @click.option("--land-zoning-field", type=str, help="Name of the land zoning dataset's field to sample with buildings.")  # fmt: skip
 @click.option("--remove-small", type=float, is_flag=False, flag_value=30, default=None, help="Remove smaller buildings, optionally specify an area threshold in square metres.  [default: 30.0]")  # fmt: skip
 @click.option("--remove-overlapping", type=float, is_flag=True, flag_value=0.80, default=None, help="Remove overlapping buildings, optionally specify an intersection ratio threshold.  [default: 0.80]")  # fmt: skip
+@click.option("--rebuild-index", is_flag=True, help="Drop the spatial index before copying and rebuild it afterwards. Faster for large initial loads.")  # fmt: skip
 def ingest_buildings(
     input_buildings: click.Path,
     input_dem: click.Path,
@@ -107,6 +127,7 @@ def ingest_buildings(
     land_zoning_field: str,
     remove_small: float,
     remove_overlapping: float,
+    rebuild_index: bool,
 ):
     """Ingest building footprints
 
@@ -129,12 +150,8 @@ def ingest_buildings(
     click.echo("Creating mask...")
     bounds = dem.bounds
     mask_geom = box(*bounds)
-    mask_df = gpd.GeoDataFrame(
-        {"id": 1, "geometry": [mask_geom]}, crs=dem_crs.to_string()
-    )
-    # Transform mask to GDA2020
-    mask_df = mask_df.to_crs(7844)
-    mask_bbox = tuple(map(float, mask_df.total_bounds))
+    # Transform mask bounds to GDA2020
+    mask_bbox = transform_bounds(dem_crs, "EPSG:7844", *bounds)
 
     click.echo("Loading building footprints...")
     try:
@@ -144,10 +161,12 @@ def ingest_buildings(
     except Exception as error:
         raise click.exceptions.FileError(input_buildings, error)
 
-    buildings = buildings.explode()
-    buildings = buildings.to_crs(
-        dem_crs.to_epsg()
-    )  # Transform buildings to CRS of our DEM
+    # Explode multi-part buildings into one row per polygon
+    parts, part_index = shapely.get_parts(buildings.geometry.values, return_index=True)
+    buildings = gpd.GeoDataFrame(
+        geometry=parts, index=buildings.index[part_index], crs=buildings.crs
+    )
+    buildings = buildings.to_crs(dem_crs)  # Transform buildings to CRS of our DEM
 
     if split_by_cadastre:
         click.echo("Splitting buildings by cadastre...")
@@ -161,15 +180,21 @@ def ingest_buildings(
         with session.begin():
             conn = session.connection()
             try:
-                # Get address points from db
+                # Get address points within the mask bounds from db
                 address_points = gpd.read_postgis(
-                    select(AddressPoint),
+                    select(AddressPoint).where(
+                        func.ST_Intersects(
+                            AddressPoint.location,
+                            func.ST_MakeEnvelope(*mask_bbox, 7844),
+                        )
+                    ),
                     conn,
                     geom_col="location",
                 )
-                # Check if the addresses are empty for the area of interest
                 address_points = address_points.to_crs(dem.crs)
-                if not ~address_points.within(mask_df.geometry.iloc[0]).all():
+                # Check if the addresses are empty for the area of interest
+                in_mask = address_points.sindex.query(mask_geom, predicate="intersects")
+                if len(in_mask) == 0:
                     raise Exception
 
             except Exception:
@@ -179,17 +204,22 @@ def ingest_buildings(
 
             buildings = etl.split_by_cadastre(address_points, buildings, cadastre)
 
+    # Keep polygons only, splitting by cadastre can also produce lines and points
+    buildings = buildings[
+        shapely.get_type_id(buildings.geometry.values) == shapely.GeometryType.POLYGON
+    ]
+
     if remove_small:
         click.echo(f"Removing buildings < {remove_small} m^2...")
-        bool_mask = buildings.area > remove_small
-        buildings = buildings[bool_mask]
-        remove_count = (bool_mask).value_counts()[False]
+        keep = shapely.area(buildings.geometry.values) > remove_small
+        buildings = buildings[keep]
+        remove_count = len(keep) - np.count_nonzero(keep)
         click.echo(f"Removed {remove_count} buildings...")
 
     if join_land_zoning:
         click.echo("Joining land zoning attribute...")
         try:
-            land_use = etl.read_ogr_file(join_land_zoning, mask=mask_df)
+            land_use = etl.read_ogr_file(join_land_zoning, mask=box(*mask_bbox))
             land_use = land_use.to_crs(dem.crs)
 
             if land_zoning_field not in land_use.columns:
@@ -208,52 +238,57 @@ def ingest_buildings(
 
     click.echo("Sampling DEM with buildings...")
     min_heights, max_heights = etl.sample_dem_with_buildings(dem, buildings)
+    np.round(min_heights, 3, out=min_heights)
+    np.round(max_heights, 3, out=max_heights)
     buildings["min_height_ahd"] = min_heights
     buildings["max_height_ahd"] = max_heights
 
-    # Drop rows outside the extent of the DEM
-    buildings = buildings[buildings["min_height_ahd"].notna()]
-    buildings = buildings[buildings["max_height_ahd"].notna()]
-
-    buildings = buildings.round({"min_height_ahd": 3, "max_height_ahd": 3})
-
-    # Remove any buildings that sample no data
-    buildings = buildings[buildings["min_height_ahd"] != dem.nodata]
-    buildings = buildings[buildings["max_height_ahd"] != dem.nodata]
+    # Drop rows outside the extent of the DEM and any buildings that sample no data
+    valid_heights = (
+        ~np.isnan(min_heights)
+        & ~np.isnan(max_heights)
+        & (min_heights != dem.nodata)
+        & (max_heights != dem.nodata)
+    )
+    buildings = buildings[valid_heights]
     buildings = buildings.to_crs(7844)  # Transform back to GDA2020
     buildings = buildings.rename_geometry("outline")
 
-    # Drop duplicate geometries
     buildings["outline"] = buildings.normalize()
-    buildings = buildings.drop_duplicates(subset="outline")
 
     # Generate UUIDs based on the building geometries
     click.echo("Generating UUIDs...")
-    buildings["id"] = buildings["outline"].apply(etl.generate_uuid)
+    buildings["id"] = etl.generate_uuids(buildings["outline"].values)
     buildings = buildings.set_index("id")
 
+    # Drop duplicate geometries, identical outlines have the same WKB based UUID
+    buildings = buildings[~buildings.index.duplicated()]
+
     click.echo("Copying to PostgreSQL...")
     session = SessionLocal()
     with session.begin():
-        conn = session.connection()
-        buildings.to_postgis(
-            "building",
-            conn,
-            schema="public",
-            if_exists="append",
-            index=True,
-            chunksize=chunksize,
-            dtype={"id": UUID},
-        )
+        if rebuild_index:
+            etl.drop_spatial_index(session, "building", "outline")
 
-        if remove_overlapping:
-            click.echo("Removing overlapping buildings...")
+        etl.copy_geodataframe(session, buildings, Building.__table__, chunksize)
+
+        if rebuild_index:
+            click.echo("Rebuilding spatial index...")
+            etl.create_spatial_index(session, "building", "outline")
+
+    if remove_overlapping:
+        click.echo("Removing overlapping buildings...")
+        # Run in a separate transaction, after the loaded rows are committed, so the
+        # self-join is planned with up to date statistics
+        with session.begin():
+            etl.analyze_table(session, "building")
             result = etl.remove_overlapping_geoms(
                 session, remove_overlapping, bbox=mask_bbox
             )
-            click.echo(f"Removed {result.rowcount} overlapping buildings...")
+            removed_count = result.rowcount
+        click.echo(f"Removed {removed_count} overlapping buildings...")
 
-        click.echo("Building ingestion complete")
+    click.echo("Building ingestion complete")
 
 
 @click.command()
@@ -273,7 +308,7 @@ def join_address_buildings(input_cadastre: click.Path, flatten_cadastre: bool):
     session = SessionLocal()
     with session.begin():
         conn = session.connection()
-        Base = declarative_base()
+        metadata = MetaData()
         click.echo("Loading cadastre...")
         try:
             cadastre_gdf = etl.read_ogr_file(input_cadastre, columns=["geometry"])
@@ -281,39 +316,40 @@ def join_address_buildings(input_cadastre: click.Path, flatten_cadastre: bool):
             raise click.exceptions.FileError(input_cadastre, error)
 
         cadastre_bbox = tuple(map(float, cadastre_gdf.total_bounds))
-        cadastre_gdf = cadastre_gdf.explode()
+        parts, part_index = shapely.get_parts(
+            cadastre_gdf.geometry.values, return_index=True
+        )
+        cadastre_gdf = gpd.GeoDataFrame(
+            geometry=parts, index=cadastre_gdf.index[part_index], crs=cadastre_gdf.crs
+        )
 
         click.echo("Copying cadastre to PostgreSQL...")
-        cadastre_gdf.to_postgis(
-            "temp_cadastre",
+        temp_cadastre = etl.load_temp_table(
+            session,
             conn,
-            schema="public",
-            if_exists="replace",
+            metadata,
+            cadastre_gdf,
+            "temp_cadastre",
             index=True,
             index_label="id",
         )
 
-        # Get temp_cadastre table model from database
-        temp_cadastre = Table("temp_cadastre", Base.metadata, autoload_with=conn)
-
         if flatten_cadastre:
             click.echo("Flattening cadastre geometries...")
             temp_cadastre = etl.flatten_cadastre_geoms(
-                session, conn, Base, temp_cadastre
+                session, conn, metadata, temp_cadastre
             )
 
-        click.echo("Performing join for building centroid addresses...")
+        click.echo("Performing join for building and property centroid addresses...")
         # Match for addresses geocoded to building centroids using KNN max distance 5m,
         # to account for inaccuracies of building footprints
-        select_query = etl.build_address_match_query(
+        select_query_building_centroid = etl.build_address_match_query(
             join_by="knn",
             geocode_type="BUILDING CENTROID",
             knn_max_distance=5,
             bbox=cadastre_bbox,
         )
-        etl.insert_address_building_association(session, select_query)
 
-        click.echo("Performing join for property centroid addresses...")
         # Create base query for joining property centroid addresses
         select_query = etl.build_address_match_query(
             join_by="cadastre",
@@ -332,14 +368,23 @@ def join_address_buildings(input_cadastre: click.Path, flatten_cadastre: bool):
             .order_by(AddressPoint.id, func.ST_Area(Building.outline).desc())
             .distinct(AddressPoint.id)
         )
-        etl.insert_address_building_association(session, select_query_non_strata)
 
         # Modify base query to join to all buildings on the parcel for primary addresses
         # (i.e. strata addresses)
         select_query_strata = select_query.where(
             AddressPoint.primary_secondary == "PRIMARY",
         )
-        etl.insert_address_building_association(session, select_query_strata)
+
+        # These matches select disjoint address points and don't depend on each other,
+        # so insert them with a single statement
+        etl.insert_address_building_association(
+            session,
+            union_all(
+                select_query_building_centroid,
+                select_query_non_strata,
+                select_query_strata,
+            ),
+        )
 
         # Finally, join by intersection for property centroid, secondary addresses
         # (i.e. strata addresses that intersect a building)
@@ -407,38 +452,63 @@ def ingest_nexis_measures(
     session = SessionLocal()
     with session.begin():
         conn = session.connection()
-        Base = declarative_base()
+        metadata = MetaData()
 
         if input_cadastre:
             try:
                 cadastre_gdf = etl.read_ogr_file(input_cadastre, columns=["geometry"])
             except Exception as error:
                 raise click.exceptions.FileError(input_cadastre, error)
-            # Clip NEXIS points to cadastre extent
-            nexis_gdf = gpd.clip(nexis_gdf, cadastre_gdf)
-        else:
-            # Subset NEXIS points based GNAF IDs in the database
-            gnaf_ids = session.execute(select(AddressPoint.gnaf_id)).all()
-            gnaf_ids = [row[0] for row in gnaf_ids]
-            nexis_gdf = nexis_gdf[nexis_gdf["lid"].isin(gnaf_ids)]
+            # Clip NEXIS points to cadastre extent, keeping points within any parcel
+            point_idx, _ = cadastre_gdf.sindex.query(
+                nexis_gdf.geometry, predicate="intersects"
+            )
+            nexis_gdf = nexis_gdf.iloc[np.unique(point_idx)]
 
-        nexis_gdf["id"] = [uuid.uuid4() for _ in range(len(nexis_gdf.index))]
+        nexis_gdf["id"] = etl.generate_random_uuids(len(nexis_gdf.index))
         nexis_gdf = nexis_gdf.set_index(["id"])
         nexis_gdf = nexis_gdf.rename_geometry("location")
 
         click.echo("Copying NEXIS points to PostgreSQL...")
-        nexis_gdf.to_postgis(
-            "temp_nexis",
+        temp_nexis = etl.load_temp_table(
+            session,
             conn,
-            schema="public",
-            if_exists="replace",
+            metadata,
+            nexis_gdf,
+            "temp_nexis",
             index=True,
             dtype={"id": UUID, "floor_height_m": Numeric, "confidence": Numeric},
         )
-        temp_nexis = Table("temp_nexis", Base.metadata, autoload_with=conn)
+
+        if not input_cadastre:
+            # Subset NEXIS points based GNAF IDs in the database
+            etl.remove_unmatched_gnaf_ids(session, temp_nexis, "lid")
+
+        if input_cadastre:
+            click.echo("Copying cadastre to PostgreSQL...")
+            temp_cadastre = etl.load_temp_table(
+                session,
+                conn,
+                metadata,
+                cadastre_gdf,
+                "temp_cadastre",
+                index=True,
+                index_label="id",
+            )
+
+            if flatten_cadastre:
+                click.echo("Flattening cadastre geometries...")
+                temp_cadastre = etl.flatten_cadastre_geoms(
+                    session, conn, metadata, temp_cadastre
+                )
 
         # Build select query to insert into the floor_measure table for GNAF ID matches
         method_id = etl.get_or_create_method_id(session, "Random Sampling")
+        # Create the dataset in a savepoint, so it is rolled back if no measures match
+        savepoint = session.begin_nested()
+        nexis_dataset_id = etl.get_or_create_dataset_id(
+            session, "NEXIS", "NEXIS flood exposure points", "Geoscience Australia"
+        )
         modelled_query_gnaf = etl.build_floor_measure_query(
             temp_nexis,
             "floor_height_m",
@@ -450,7 +520,9 @@ def ingest_nexis_measures(
         )
 
         click.echo("Inserting GNAF records into floor_measure table...")
-        modelled_inserted_ids = etl.insert_floor_measure(session, modelled_query_gnaf)
+        inserted_count = etl.insert_floor_measure(
+            session, modelled_query_gnaf, nexis_dataset_id
+        )
 
         click.echo("Inserting non-GNAF records into floor_measure table...")
         # Build select queries to insert into the floor_measure table for non-GNAF addresses
@@ -466,30 +538,11 @@ def ingest_nexis_measures(
             # Modify the query to select non-GNAF addresses
             temp_nexis.c.lid.notlike("GA%")
         )
-        modelled_query_intersect_ids = etl.insert_floor_measure(
-            session, modelled_query_intersect
+        inserted_count += etl.insert_floor_measure(
+            session, modelled_query_intersect, nexis_dataset_id
         )
 
-        modelled_inserted_ids += modelled_query_intersect_ids
-
         if input_cadastre:
-            click.echo("Copying cadastre to PostgreSQL...")
-            cadastre_gdf.to_postgis(
-                "temp_cadastre",
-                conn,
-                schema="public",
-                if_exists="replace",
-                index=True,
-                index_label="id",
-            )
-            temp_cadastre = Table("temp_cadastre", Base.metadata, autoload_with=conn)
-
-            if flatten_cadastre:
-                click.echo("Flattening cadastre geometries...")
-                temp_cadastre = etl.flatten_cadastre_geoms(
-                    session, conn, Base, temp_cadastre
-                )
-
             # Second, by joining to buildings with a common cadastre parcel
             modelled_query_cadastre = etl.build_floor_measure_query(
                 temp_nexis,
@@ -507,23 +560,14 @@ def ingest_nexis_measures(
                 modelled_query_cadastre = modelled_query_cadastre.order_by(
                     temp_nexis.c.id, func.ST_Area(Building.outline).desc()
                 ).distinct(temp_nexis.c.id)
-            modelled_inserted_cadastre_ids = etl.insert_floor_measure(
-                session, modelled_query_cadastre
+            inserted_count += etl.insert_floor_measure(
+                session, modelled_query_cadastre, nexis_dataset_id
             )
 
-            # Concat the inserted id lists
-            modelled_inserted_ids += modelled_inserted_cadastre_ids
-
-        # List of tuples to list of ids
-        modelled_inserted_ids = [id for (id,) in modelled_inserted_ids]
-
-        if modelled_inserted_ids:
-            nexis_dataset_id = etl.get_or_create_dataset_id(
-                session, "NEXIS", "NEXIS flood exposure points", "Geoscience Australia"
-            )
-            etl.insert_floor_measure_dataset_association(
-                session, nexis_dataset_id, modelled_inserted_ids
-            )
+        if inserted_count:
+            savepoint.commit()
+        else:
+            savepoint.rollback()
 
         temp_nexis.drop(conn)
         if input_cadastre:
@@ -593,26 +637,24 @@ def ingest_validation_measures(
     method_gdf = method_gdf.rename(columns={ffh_field: "floor_height_m"})
     method_gdf = method_gdf.rename_geometry("location")
     method_gdf = method_gdf.dropna(subset=["floor_height_m"])
-    method_gdf.columns = method_gdf.columns.str.lower().str.replace(
-        r"\W+", "", regex=True
-    )
-    method_gdf["id"] = [uuid.uuid4() for _ in range(len(method_gdf.index))]
+    method_gdf.columns = etl.clean_column_names(method_gdf.columns)
+    method_gdf["id"] = etl.generate_random_uuids(len(method_gdf.index))
     method_gdf = method_gdf.set_index(["id"])
 
     session = SessionLocal()
     with session.begin():
         conn = session.connection()
-        Base = declarative_base()
+        metadata = MetaData()
         click.echo("Copying validation points to PostgreSQL...")
-        method_gdf.to_postgis(
-            "temp_method",
+        temp_method = etl.load_temp_table(
+            session,
             conn,
-            schema="public",
-            if_exists="replace",
+            metadata,
+            method_gdf,
+            "temp_method",
             index=True,
             dtype={"id": UUID, "floor_height_m": Numeric, "confidence": Numeric},
         )
-        temp_method = Table("temp_method", Base.metadata, autoload_with=conn)
 
         if input_cadastre:
             try:
@@ -621,173 +663,87 @@ def ingest_validation_measures(
                 raise click.exceptions.FileError(input_cadastre, error)
 
             click.echo("Copying cadastre to PostgreSQL...")
-            cadastre_gdf.to_postgis(
-                "temp_cadastre",
+            temp_cadastre = etl.load_temp_table(
+                session,
                 conn,
-                schema="public",
-                if_exists="replace",
+                metadata,
+                cadastre_gdf,
+                "temp_cadastre",
                 index=True,
                 index_label="id",
             )
-            temp_cadastre = Table("temp_cadastre", Base.metadata, autoload_with=conn)
 
         if flatten_cadastre:
             click.echo("Flattening cadastre geometries...")
             temp_cadastre = etl.flatten_cadastre_geoms(
-                session, conn, Base, temp_cadastre
+                session, conn, metadata, temp_cadastre
             )
 
-        # If no step size is provided, we ingest all measures as a single method
+        # If no step size is provided, we ingest all measures as a single method,
+        # otherwise separate measures into step counting and surveyed methods
         if step_size is None:
-            method_id = etl.get_or_create_method_id(session, method_name)
-
             click.echo("Inserting validation measures into floor_measure table...")
-            # First, join by point-building intersection
-            click.echo("Joining by intersection...")
-            survey_intersects_query = etl.build_floor_measure_query(
-                temp_method,
-                "floor_height_m",
-                method_id,
-                "confidence",
-                storey=0,
-                join_by="intersects",
-                step_counting=False,
-                step_size=None,
-            )
-            survey_intersects_ids = etl.insert_floor_measure(
-                session, survey_intersects_query
-            )
-
-            validation_ids = survey_intersects_ids
-
-            if input_cadastre:
-                click.echo("Joining by cadastre...")
-                # Second, join to buildings with a common cadastre parcel
-                survey_cadastre_query = etl.build_floor_measure_query(
-                    temp_method,
-                    "floor_height_m",
-                    method_id,
-                    "confidence",
-                    storey=0,
-                    join_by="cadastre",
-                    step_counting=False,
-                    step_size=None,
-                    cadastre=temp_cadastre,
-                )
-
-                if join_largest:
-                    click.echo("Joining with largest building on parcel...")
-                    # Modify select to join to largest building on the parcel for distinct points
-                    survey_query_cadastre = survey_cadastre_query.order_by(
-                        temp_method.c.id, func.ST_Area(Building.outline).desc()
-                    ).distinct(temp_method.c.id)
-
-                survey_cadastre_ids = etl.insert_floor_measure(
-                    session, survey_query_cadastre
-                )
-
-                validation_ids += survey_cadastre_ids
-
-        # If step size is provided, separate measures into surveyed and step counting
+            methods = [(etl.get_or_create_method_id(session, method_name), False)]
         else:
             click.echo(
                 "Inserting surveyed & step counted measures into floor_measure table..."
             )
-
-            survey_id = etl.get_or_create_method_id(session, "Surveyed")
             step_count_id = (
                 etl.get_or_create_method_id(session, "Step counting")
                 if step_size
                 else None
             )
-            # Join by point-building intersection
-            click.echo("Joining by intersection...")
-            step_count_intersects_query = etl.build_floor_measure_query(
-                temp_method,
-                "floor_height_m",
-                step_count_id,
-                "confidence",
-                storey=0,
-                join_by="intersects",
-                step_counting=True,
-                step_size=step_size,
-            )
-            step_count_intersects_ids = etl.insert_floor_measure(
-                session, step_count_intersects_query
-            )
-            survey_intersects_query = etl.build_floor_measure_query(
-                temp_method,
-                "floor_height_m",
-                survey_id,
-                "confidence",
-                storey=0,
-                join_by="intersects",
-                step_counting=False,
-                step_size=step_size,
-            )
-            survey_intersects_ids = etl.insert_floor_measure(
-                session, survey_intersects_query
-            )
-            validation_ids = step_count_intersects_ids + survey_intersects_ids
+            methods = [
+                (step_count_id, True),
+                (etl.get_or_create_method_id(session, "Surveyed"), False),
+            ]
 
-            if input_cadastre:
-                click.echo("Joining by cadastre...")
-                # Join to buildings with a common cadastre parcel
-                step_count_cadastre_query = etl.build_floor_measure_query(
-                    temp_method,
-                    "floor_height_m",
-                    step_count_id,
-                    "confidence",
-                    storey=0,
-                    join_by="cadastre",
-                    step_counting=True,
-                    step_size=step_size,
-                    cadastre=temp_cadastre,
-                )
-                survey_cadastre_query = etl.build_floor_measure_query(
+        # Create the dataset in a savepoint, so it is rolled back if no measures match
+        savepoint = session.begin_nested()
+        if not dataset_name:
+            dataset_name = input_data
+        dataset_id = etl.get_or_create_dataset_id(
+            session, dataset_name, dataset_desc, dataset_src
+        )
+
+        def insert_measures(join_by: str, **kwargs) -> int:
+            inserted_count = 0
+            for method_id, step_counting in methods:
+                query = etl.build_floor_measure_query(
                     temp_method,
                     "floor_height_m",
-                    survey_id,
+                    method_id,
                     "confidence",
                     storey=0,
-                    join_by="cadastre",
-                    step_counting=False,
+                    join_by=join_by,
+                    step_counting=step_counting,
                     step_size=step_size,
-                    cadastre=temp_cadastre,
+                    **kwargs,
                 )
-
-                if join_largest:
-                    click.echo("Joining with largest building on parcel...")
-                    # Modify select to join to largest building on the parcel for distinct points
-                    step_count_query_cadastre = step_count_cadastre_query.order_by(
-                        temp_method.c.id, func.ST_Area(Building.outline).desc()
-                    ).distinct(temp_method.c.id)
-                    survey_query_cadastre = survey_cadastre_query.order_by(
+                if join_by == "cadastre" and join_largest:
+                    # Modify select to join to largest building on the parcel for
+                    # distinct points
+                    query = query.order_by(
                         temp_method.c.id, func.ST_Area(Building.outline).desc()
                     ).distinct(temp_method.c.id)
+                inserted_count += etl.insert_floor_measure(session, query, dataset_id)
+            return inserted_count
 
-                step_count_cadastre_ids = etl.insert_floor_measure(
-                    session, step_count_query_cadastre
-                )
-                survey_cadastre_ids = etl.insert_floor_measure(
-                    session, survey_query_cadastre
-                )
-
-                validation_ids += step_count_cadastre_ids + survey_cadastre_ids
-
-        # List of tuples to list of ids
-        validation_ids = [id for (id,) in validation_ids]
+        # First, join by point-building intersection
+        click.echo("Joining by intersection...")
+        inserted_count = insert_measures("intersects")
 
-        if validation_ids:
-            if not dataset_name:
-                dataset_name = input_data
+        if input_cadastre:
+            # Second, join to buildings with a common cadastre parcel
+            click.echo("Joining by cadastre...")
+            if join_largest:
+                click.echo("Joining with largest building on parcel...")
+            inserted_count += insert_measures("cadastre", cadastre=temp_cadastre)
 
-            dataset_id = etl.get_or_create_dataset_id(
-                session, dataset_name, dataset_desc, dataset_src
-            )
-            etl.insert_floor_measure_dataset_association(
-                session, dataset_id, validation_ids
-            )
+        if inserted_count:
+            savepoint.commit()
+        else:
+            savepoint.rollback()
 
         temp_method.drop(conn)
         if input_cadastre:
@@ -815,12 +771,11 @@ def ingest_main_method_measures(
     click.secho("Ingesting Main Methodology measures", bold=True)
     try:
         click.echo("Loading Floor Height parquet...")
-        method_df = pd.read_parquet(input_file)
+        method_df = etl.read_floor_height_parquet(input_file)
     except Exception as error:
         raise click.exceptions.FileError(input_file, error)
 
-    # Drop original geometry, set to location of door
-    method_df = method_df.drop(columns=["geometry"])
+    # Set geometry to location of door
     method_gdf = gpd.GeoDataFrame(
         method_df,
         geometry=gpd.points_from_xy(
@@ -832,15 +787,25 @@ def ingest_main_method_measures(
     method_gdf["storey"] = 0
 
     # Cast building_id strings to UUIDs
-    method_gdf["building_id"] = method_gdf["building_id"].apply(uuid.UUID)
+    method_gdf["building_id"] = [
+        uuid.UUID(building_id) for building_id in method_gdf["building_id"].to_numpy()
+    ]
 
     # Make method input column names lower case and remove special characters
-    method_gdf.columns = method_gdf.columns.str.lower().str.replace(
-        r"\W+", "", regex=True
-    )
+    method_gdf.columns = etl.clean_column_names(method_gdf.columns)
+
+    methods = {
+        "ffh1": "Main Method - FFH1",
+        "ffh2": "Main Method - FFH2",
+        "ffh3": "Main Method - FFH3",
+    }
+
+    # Drop rows without a measure for any method before deserialising and building
+    # aux_info, these rows are never ingested
+    method_gdf = method_gdf[method_gdf[list(methods)].notna().any(axis=1)]
 
     # Deserialise bboxes as a list of dicts
-    method_gdf["bboxes"] = method_gdf["bboxes"].apply(lambda row: json.loads(row))
+    method_gdf["bboxes"] = [json.loads(row) for row in method_gdf["bboxes"].to_numpy()]
 
     # Create aux_info json column
     aux_info_df = method_gdf.drop(
@@ -851,28 +816,26 @@ def ingest_main_method_measures(
             "location",
         ],
         axis=1,
-    ).copy()
-    aux_info_df = aux_info_df.replace(np.nan, None)
-    method_gdf["aux_info"] = aux_info_df.apply(
-        lambda row: json.dumps(row.to_dict()), axis=1
-    )
+    ).replace(np.nan, None)
+    method_gdf["aux_info"] = [
+        json.dumps(record) for record in aux_info_df.to_dict("records")
+    ]
 
     session = SessionLocal()
     with session.begin():
-        conn = session.connection()
         click.echo("Inserting records into floor_measure table...")
 
-        methods = {
-            "ffh1": "Main Method - FFH1",
-            "ffh2": "Main Method - FFH2",
-            "ffh3": "Main Method - FFH3",
-        }
+        # The dataset is created with the first method that has measures
+        method_dataset_id = None
 
         # Iterate methods from the processing output and ingest measures
         for method_field, method_name in methods.items():
-            # Filter method_gdf for the current method
-            method_gdf_filtered = method_gdf[method_gdf[method_field].notna()].copy()
-            method_gdf_filtered["height"] = method_gdf_filtered[method_field]
+            # Filter method_gdf for the current method, copying only the columns that
+            # are ingested rather than every attribute already held in aux_info
+            method_gdf_filtered = method_gdf.loc[
+                method_gdf[method_field].notna(),
+                ["building_id", "storey", "location", "aux_info"],
+            ].assign(height=method_gdf[method_field])
 
             # Drop duplicates based on building_id and height
             method_gdf_filtered = method_gdf_filtered.drop_duplicates(
@@ -884,34 +847,20 @@ def ingest_main_method_measures(
                 continue
 
             method_id = etl.get_or_create_method_id(session, method_name)
-            method_dataset_id = etl.get_or_create_dataset_id(
-                session, dataset_name, dataset_desc, dataset_src
-            )
+            if method_dataset_id is None:
+                method_dataset_id = etl.get_or_create_dataset_id(
+                    session, dataset_name, dataset_desc, dataset_src
+                )
 
             method_gdf_filtered["method_id"] = method_id
 
             # Create UUID index
-            method_gdf_filtered["id"] = [
-                uuid.uuid4() for _ in range(len(method_gdf_filtered.index))
-            ]
-            method_gdf_filtered = method_gdf_filtered.set_index(["id"])
+            measure_ids = etl.generate_random_uuids(len(method_gdf_filtered.index))
+            method_gdf_filtered.index = pd.Index(measure_ids, name="id")
 
             try:
-                method_gdf_filtered.drop(
-                    columns=aux_info_df.columns, axis=1
-                ).to_postgis(
-                    "floor_measure",
-                    conn,
-                    schema="public",
-                    if_exists="append",
-                    index=True,
-                    dtype={
-                        "id": UUID,
-                        "building_id": UUID,
-                        "method_id": UUID,
-                        "height": Numeric,
-                        "aux_info": JSON,
-                    },
+                etl.copy_geodataframe(
+                    session, method_gdf_filtered, FloorMeasure.__table__
                 )
             except psycopg2.errors.ForeignKeyViolation:
                 raise click.UsageError(
@@ -921,7 +870,7 @@ def ingest_main_method_measures(
                 )
 
             etl.insert_floor_measure_dataset_association(
-                session, method_dataset_id, method_gdf_filtered.index.tolist()
+                session, method_dataset_id, measure_ids
             )
 
     click.echo("Main methodology ingestion complete")
@@ -954,7 +903,7 @@ def ingest_gap_fill_measures(
     click.secho("Ingesting Gap Fill measures", bold=True)
     try:
         click.echo("Loading Floor Height parquet...")
-        method_df = pd.read_parquet(input_file)
+        method_df = etl.read_floor_height_parquet(input_file)
     except Exception as error:
         raise click.exceptions.FileError(input_file, error)
 
@@ -971,7 +920,6 @@ def ingest_gap_fill_measures(
             f"Field '{confidence_field}' not found in input parquet file"
         )
 
-    method_df = method_df.drop(columns=["geometry"])
     method_df["height"] = method_df[ffh_field]
     method_df = method_df[~method_df["height"].isna()]
     method_df["storey"] = 0
@@ -980,15 +928,15 @@ def ingest_gap_fill_measures(
     )
 
     # Cast building_id strings to UUIDs
-    method_df["building_id"] = method_df["building_id"].apply(uuid.UUID)
+    method_df["building_id"] = [
+        uuid.UUID(building_id) for building_id in method_df["building_id"].to_numpy()
+    ]
 
     # Make method input column names lower case and remove special characters
-    method_df.columns = method_df.columns.str.lower().str.replace(
-        r"\W+", "", regex=True
-    )
+    method_df.columns = etl.clean_column_names(method_df.columns)
 
     # Deserialise bboxes as a list of dicts
-    method_df["bboxes"] = method_df["bboxes"].apply(lambda row: json.loads(row))
+    method_df["bboxes"] = [json.loads(row) for row in method_df["bboxes"].to_numpy()]
 
     # Create aux_info json column
     aux_info_df = method_df.drop(
@@ -1000,11 +948,10 @@ def ingest_gap_fill_measures(
             "confidence",
         ],
         axis=1,
-    ).copy()
-    aux_info_df = aux_info_df.replace(np.nan, None)
-    method_df["aux_info"] = aux_info_df.apply(
-        lambda row: json.dumps(row.to_dict()), axis=1
-    )
+    ).replace(np.nan, None)
+    method_df["aux_info"] = [
+        json.dumps(record) for record in aux_info_df.to_dict("records")
+    ]
     method_df = method_df.drop(columns=aux_info_df.columns, axis=1)
 
     # Drop duplicates based on building_id and height
@@ -1014,8 +961,8 @@ def ingest_gap_fill_measures(
     method_df = method_df.loc[method_df.groupby("building_id")["confidence"].idxmax()]
 
     # Create UUID index
-    method_df["id"] = [uuid.uuid4() for _ in range(len(method_df.index))]
-    method_df = method_df.set_index(["id"])
+    measure_ids = etl.generate_random_uuids(len(method_df.index))
+    method_df.index = pd.Index(measure_ids, name="id")
 
     session = SessionLocal()
     with session.begin():
@@ -1054,7 +1001,7 @@ def ingest_gap_fill_measures(
             )
 
         etl.insert_floor_measure_dataset_association(
-            session, method_dataset_id, method_df.index.tolist()
+            session, method_dataset_id, measure_ids
         )
 
     click.echo("Gap Fill ingestion complete")
@@ -1110,17 +1057,18 @@ def ingest_main_method_images(
                 image_df = measure_df[["id", filename_field]].copy()
                 image_df = image_df.rename(columns={"id": "floor_measure_id"})
                 # Generate UUIDs based on image filenames
-                image_df["id"] = image_df[filename_field].apply(etl.generate_uuid)
+                image_df["id"] = etl.generate_uuids(image_df[filename_field])
 
-                # Get image filepaths
-                image_df[filename_field] = image_df[filename_field].apply(
-                    lambda filename: Path(image_path) / Path(filename).name
-                )
+                # Get image filenames and filepaths, parsing each path only once
+                image_df["filename"] = [
+                    Path(filename).name for filename in image_df[filename_field]
+                ]
+                image_dir = Path(image_path)
+                image_df[filename_field] = [
+                    image_dir / filename for filename in image_df["filename"]
+                ]
 
                 # Add additional fields
-                image_df["filename"] = image_df[filename_field].apply(
-                    lambda path: Path(path).name
-                )
                 image_df["type"] = image_type
 
                 # Create association table dataframe
@@ -1137,43 +1085,42 @@ def ingest_main_method_images(
                 image_df = image_df.drop_duplicates(subset=["id"])
                 image_df = image_df.set_index("id")
 
-                # Create byte arrays of the images
-                image_df["image_data"] = image_df[filename_field].apply(
-                    lambda filename: image_to_bytearray(filename)
-                )
-
-                image_df = image_df[image_df["image_data"].notna()]
-                image_df = image_df.drop(
-                    columns=[filename_field, "floor_measure_id"],
-                    axis=1,
-                )
-
-                try:
-                    image_df.to_sql(
-                        "floor_measure_image",
-                        conn,
-                        schema="public",
-                        if_exists="append",
-                        index=True,
-                        dtype={
-                            "id": UUID,
-                            "image_data": LargeBinary,
-                            "type": String,
-                        },
-                        chunksize=chunksize,
-                    )
-                except OperationalError:
-                    raise click.ClickException(
-                        "An error occurred while inserting images into the database. "
-                        "Try again with a smaller chunksize (e.g. 200) or check the "
-                        "database connection."
-                    )
-                except IntegrityError:
-                    raise click.ClickException(
-                        "An error occurred while inserting images into the database. "
-                        "This may be due to duplicate image IDs. Ensure that images "
-                        "have not already been ingested."
-                    )
+                image_paths = image_df.pop(filename_field)
+                image_df = image_df.drop(columns=["floor_measure_id"])
+
+                # Read and copy the images one chunk at a time, so only a chunk of
+                # images is held in memory. Files are read concurrently as the reads
+                # are I/O bound
+                step = chunksize or max(len(image_df.index), 1)
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    for start in range(0, len(image_df.index), step):
+                        image_data = list(
+                            executor.map(
+                                image_to_bytearray,
+                                image_paths.iloc[start : start + step],
+                            )
+                        )
+                        image_chunk = image_df.iloc[start : start + step].assign(
+                            image_data=image_data
+                        )
+                        image_chunk = image_chunk[image_chunk["image_data"].notna()]
+
+                        try:
+                            etl.copy_geodataframe(
+                                session, image_chunk, FloorMeasureImage.__table__
+                            )
+                        except psycopg2.OperationalError:
+                            raise click.ClickException(
+                                "An error occurred while inserting images into the "
+                                "database. Try again with a smaller chunksize (e.g. "
+                                "200) or check the database connection."
+                            )
+                        except psycopg2.IntegrityError:
+                            raise click.ClickException(
+                                "An error occurred while inserting images into the "
+                                "database. This may be due to duplicate image IDs. "
+                                "Ensure that images have not already been ingested."
+                            )
 
                 etl.insert_floor_measure_floor_measure_image_association(
                     session, image_assoc_dict
@@ -1241,11 +1188,28 @@ def download_images_s3(
 
     image_df = image_df[image_df.region.isin(areas)]
 
-    s3 = boto3.client("s3")
+    # boto3 clients are thread safe, size the connection pool to match the workers
+    max_workers = 32
+    s3 = boto3.client("s3", config=Config(max_pool_connections=max_workers))
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    def download_image(image: str, type_output_dir: Path):
+        # Get bucket name and S3 key from the URI
+        parsed = urlparse(image)
+        bucket_name = parsed.netloc
+        s3_key = parsed.path.lstrip("/")
+
+        try:
+            # Download the file from S3
+            local_file_path = type_output_dir / Path(s3_key).name
+            s3.download_file(bucket_name, s3_key, str(local_file_path))
+        except (NoCredentialsError, PartialCredentialsError):
+            raise
+        except Exception as error:
+            click.echo(f"Failed to download {s3_key}: {error}", err=True)
+
     for image_type in type:
         uri_field = "clip_path" if image_type == "pano" else "lidar_clip_path"
         type_output_dir = output_dir / (f"{image_type}_images")
@@ -1254,27 +1218,28 @@ def download_images_s3(
         image_df = image_df[~image_df[uri_field].isna()]
         image_df = image_df.drop_duplicates(subset=[uri_field])
 
-        with click.progressbar(
-            image_df[uri_field], label=f"Downloading {image_type} images"
-        ) as bar:
-            for image in bar:
-                # Get bucket name and S3 key from the URI
-                parsed = urlparse(image)
-                bucket_name = parsed.netloc
-                s3_key = parsed.path.lstrip("/")
-
+        # Downloads are network bound, so overlap them across a pool of threads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(download_image, image, type_output_dir)
+                for image in image_df[uri_field]
+            ]
+            with click.progressbar(
+                as_completed(futures),
+                length=len(futures),
+                label=f"Downloading {image_type} images",
+            ) as bar:
                 try:
-                    # Download the file from S3
-                    local_file_path = type_output_dir / Path(s3_key).name
-                    s3.download_file(bucket_name, s3_key, str(local_file_path))
-                except NoCredentialsError:
-                    raise click.ClickException("AWS credentials not found.")
-                except PartialCredentialsError:
+                    for future in bar:
+                        future.result()
+                except (NoCredentialsError, PartialCredentialsError) as error:
+                    for future in futures:
+                        future.cancel()
+                    if isinstance(error, NoCredentialsError):
+                        raise click.ClickException("AWS credentials not found.")
                     raise click.ClickException(
                         "Incomplete AWS credentials configuration."
                     )
-                except Exception as error:
-                    click.echo(f"Failed to download {s3_key}: {error}", err=True)
 
     click.echo("Image download complete")
 
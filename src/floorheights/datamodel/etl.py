@@ -1,26 +1,42 @@
 import csv
 import json
+import os
+import re
+import struct
 import uuid
 from collections.abc import Iterable
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Literal
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import rasterio
+import shapely
 from geoalchemy2 import Geography, Geometry
+from pandas.io.sql import SQLDatabase
 from pyproj import CRS
-from rasterio.mask import mask
+from rasterio.features import geometry_mask
+from rasterio.transform import rowcol
+from rasterio.windows import Window, transform as window_transform
 from shapely.geometry.base import BaseGeometry
 from sqlalchemy import (
     BinaryExpression,
     Column,
+    CompoundSelect,
+    Float,
+    JSON,
     Integer,
+    LargeBinary,
+    MetaData,
     Result,
     Select,
+    String,
     Table,
+    UUID,
+    Uuid,
     delete,
     exists,
     func,
@@ -72,12 +88,83 @@ def generate_uuid(field):
     return uuid.uuid5(uuid.NAMESPACE_OID, value)
 
 
+def generate_uuids(values: pd.Series | np.ndarray) -> list[uuid.UUID]:
+    """
+    Generates UUIDs for an array of fields, matching `generate_uuid` for each field.
+
+    Geometries are converted to WKB in a single vectorised call rather than one call
+    per geometry, and UUIDs are generated without dispatching through pandas apply.
+
+    Parameters
+    ----------
+    values : pd.Series or np.ndarray
+        The input fields, either all geometries or all non-geometry values.
+
+    Returns
+    -------
+    list of uuid.UUID
+        The generated UUIDs, in the same order as the input fields.
+    """
+    values = np.asarray(values, dtype=object)
+    if len(values) and isinstance(values[0], BaseGeometry):
+        wkbs = shapely.to_wkb(values)
+        keys = [str(None) if wkb is None else wkb.hex() for wkb in wkbs]
+    else:
+        keys = [str(value) for value in values]
+    return [uuid.uuid5(uuid.NAMESPACE_OID, key) for key in keys]
+
+
+def generate_random_uuids(n: int) -> list[uuid.UUID]:
+    """
+    Generates random UUIDs using the UUID version 4 algorithm.
+
+    The random bytes for all UUIDs are drawn from the OS in a single call, and the
+    version and variant bits are set with NumPy, rather than calling uuid.uuid4 for
+    each UUID.
+
+    Parameters
+    ----------
+    n : int
+        Number of UUIDs to generate.
+
+    Returns
+    -------
+    list of uuid.UUID
+        The generated UUIDs.
+    """
+    buf = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    buf[:, 6] = (buf[:, 6] & 0x0F) | 0x40  # Version 4
+    buf[:, 8] = (buf[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    return [uuid.UUID(bytes=row.tobytes()) for row in buf]
+
+
+_NON_WORD_CHARS = re.compile(r"\W+")
+
+
+def clean_column_names(columns: Iterable[str]) -> list[str]:
+    """
+    Lower case column names and remove any special characters from them.
+
+    Parameters
+    ----------
+    columns : Iterable of str
+        The input column names.
+
+    Returns
+    -------
+    list of str
+        The cleaned column names, in the same order as the input.
+    """
+    return [_NON_WORD_CHARS.sub("", column.lower()) for column in columns]
+
+
 def read_ogr_file(input_file: str, **kwargs) -> gpd.GeoDataFrame:
     """
     Read OGR file into a GeoDataFrame.
 
-    If the input OGR file's geodetic datum is GDA1994, transform it to GDA2020 for
-    ingestion into PostgreSQL.
+    Non-parquet files are read with the pyogrio engine, decoding attributes through
+    Arrow rather than record by record. If the input OGR file's geodetic datum is
+    GDA1994, transform it to GDA2020 for ingestion into PostgreSQL.
 
     Parameters
     ----------
@@ -94,7 +181,7 @@ def read_ogr_file(input_file: str, **kwargs) -> gpd.GeoDataFrame:
     if input_file.endswith(".parquet") or input_file.endswith(".geoparquet"):
         gdf = gpd.read_parquet(input_file, **kwargs)
     else:
-        gdf = gpd.read_file(input_file, **kwargs)
+        gdf = gpd.read_file(input_file, engine="pyogrio", use_arrow=True, **kwargs)
 
     if gdf.crs.geodetic_crs.equals(CRS.from_epsg(7844).geodetic_crs) is False:
         gdf = gdf.to_crs(7844)
@@ -150,7 +237,7 @@ def read_nexis_csv(input_nexis: str, crs: int = 4283) -> gpd.GeoDataFrame:
     )
 
     # Make NEXIS input column names lower case and remove special characters
-    nexis_df.columns = nexis_df.columns.str.lower().str.replace(r"\W+", "", regex=True)
+    nexis_df.columns = clean_column_names(nexis_df.columns)
     # Remove "_GNAF" prefix
     nexis_df.lid = nexis_df.lid.str.removeprefix("GNAF_")
 
@@ -167,6 +254,27 @@ def read_nexis_csv(input_nexis: str, crs: int = 4283) -> gpd.GeoDataFrame:
     return nexis_gdf
 
 
+def read_floor_height_parquet(input_file: str) -> pd.DataFrame:
+    """
+    Read a floor height parquet output from the processing workflow into a DataFrame.
+
+    The parquet's original geometry column isn't read, measures are located by their
+    door coordinates instead, so its WKB is never decoded.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to the input parquet file.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing all non-geometry columns from the parquet file.
+    """
+    columns = [c for c in pq.read_schema(input_file).names if c != "geometry"]
+    return pd.read_parquet(input_file, columns=columns)
+
+
 def psql_insert_copy(
     table: pd.io.sql.SQLTable,
     conn: Engine | Connection,
@@ -211,41 +319,242 @@ def psql_insert_copy(
         cur.copy_expert(sql=sql, file=s_buf)
 
 
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack(">h", -1)
+_PGCOPY_NULL = struct.pack(">i", -1)
+
+
+def _encode_copy_fields(values: np.ndarray, column: Column) -> list[bytes]:
+    """
+    Encode a column of values as length-prefixed PostgreSQL binary COPY fields.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values of the column, missing values are written as NULL.
+    column : Column
+        SQLAlchemy column the values are copied into, its type sets the encoding.
+
+    Returns
+    -------
+    list of bytes
+        Encoded field for each value.
+    """
+    if isinstance(column.type, Geometry):
+        # PostGIS accepts EWKB as the binary input of the geometry type
+        geoms = shapely.set_srid(values, column.type.srid)
+        encoded = shapely.to_wkb(geoms, hex=False, include_srid=True)
+    elif isinstance(column.type, Uuid):
+        # Generated ids are already UUID objects, only parse values that are not
+        encoded = [
+            (
+                v.bytes
+                if isinstance(v, uuid.UUID)
+                else None if pd.isna(v) else uuid.UUID(str(v)).bytes
+            )
+            for v in values
+        ]
+    elif isinstance(column.type, Integer):
+        encoded = [None if pd.isna(v) else struct.pack(">i", int(v)) for v in values]
+    elif isinstance(column.type, Float):
+        values = values.astype(float)
+        packed = values.astype(">f8").tobytes()
+        encoded = [
+            None if np.isnan(v) else packed[i * 8 : i * 8 + 8]
+            for i, v in enumerate(values)
+        ]
+    elif isinstance(column.type, String):
+        encoded = [None if pd.isna(v) else str(v).encode() for v in values]
+    elif isinstance(column.type, JSON):
+        # json is sent as text, strings are taken to be already serialised JSON
+        encoded = [
+            (
+                None
+                if v is None
+                else v.encode() if isinstance(v, str) else json.dumps(v).encode()
+            )
+            for v in values
+        ]
+    elif isinstance(column.type, LargeBinary):
+        # bytea is sent as the raw bytes, without any escaping
+        encoded = [None if v is None else bytes(v) for v in values]
+    else:
+        raise TypeError(
+            f"Column '{column.name}' of type {column.type} is not supported by "
+            "binary COPY"
+        )
+
+    return [
+        _PGCOPY_NULL if v is None else struct.pack(">i", len(v)) + v for v in encoded
+    ]
+
+
+def copy_geodataframe(
+    session: Session,
+    gdf: gpd.GeoDataFrame,
+    table: Table,
+    chunksize: int | None = None,
+) -> None:
+    """
+    Bulk load a GeoDataFrame into an existing table using PostgreSQL's binary COPY.
+
+    Geometries are sent as EWKB bytes, which avoids the hex text encoding used by
+    GeoDataFrame.to_postgis and the parsing of that text on the server. A named index
+    is copied as a column. Geometries are transformed to the SRID of their column if
+    their CRS differs.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame to copy, column names must match the table's columns.
+    table : Table
+        SQLAlchemy table to copy into.
+    chunksize : int, optional
+        Number of rows to copy at a time, by default all rows are copied at once.
+
+    Returns
+    -------
+    None
+    """
+    df = gdf.reset_index() if gdf.index.name else gdf
+    columns = [table.c[name] for name in df.columns]
+    column_names = ", ".join([f'"{c.name}"' for c in columns])
+    sql = f"COPY {table.name} ({column_names}) FROM STDIN WITH (FORMAT BINARY)"
+    field_count = struct.pack(">h", len(columns))
+    chunksize = chunksize or max(len(df), 1)
+
+    arrays = {}
+    for column in columns:
+        values = df[column.name]
+        if isinstance(column.type, Geometry):
+            # EWKB is stamped with the column SRID, so coordinates must be in it
+            if values.crs is None:
+                raise ValueError(f"Geometry column '{column.name}' has no CRS")
+            if values.crs.to_epsg() != column.type.srid:
+                values = values.to_crs(column.type.srid)
+        arrays[column.name] = values.to_numpy()
+
+    dbapi_conn = session.connection().connection
+    with dbapi_conn.cursor() as cur:
+        for start in range(0, len(df), chunksize):
+            stop = start + chunksize
+            fields = [
+                _encode_copy_fields(arrays[c.name][start:stop], c) for c in columns
+            ]
+            buf = BytesIO()
+            buf.write(_PGCOPY_HEADER)
+            for row in zip(*fields):
+                buf.write(field_count)
+                buf.write(b"".join(row))
+            buf.write(_PGCOPY_TRAILER)
+            buf.seek(0)
+            cur.copy_expert(sql=sql, file=buf)
+
+
 def sample_dem_with_buildings(
-    dem: rasterio.io.DatasetReader, buildings: gpd.GeoDataFrame
+    dem: rasterio.io.DatasetReader,
+    buildings: gpd.GeoDataFrame,
+    max_in_memory_pixels: int = 250_000_000,
 ) -> tuple:
     """
     Sample minimum and maximum elevation values from a DEM for each building geometry.
 
+    Each building's pixel window is derived from its bounds with a single vectorised
+    rowcol transform. If the DEM window covering all buildings has no more than
+    `max_in_memory_pixels` pixels, it is read once and building windows are sliced
+    from memory, otherwise each building window is read from the dataset. Pixels
+    touched by a building footprint are masked within its window, and DEM nodata
+    pixels are ignored, before taking the min and max.
+
     Parameters
     ----------
     dem : rasterio.io.DatasetReader
         DEM raster dataset.
     buildings : gpd.GeoDataFrame
         GeoDataFrame containing building geometries.
+    max_in_memory_pixels : int, optional
+        Largest DEM window, in pixels, that is read into memory in one go, by default
+        250,000,000 (~1 GB of float32).
 
     Returns
     -------
     tuple
-        Two lists containing minimum and maximum elevation values for each building.
+        Two arrays containing minimum and maximum elevation values for each building.
+        Buildings outside the raster bounds are given the DEM's nodata value, buildings
+        covering only nodata pixels are given NaN.
     """
-    min_heights = []
-    max_heights = []
+    geoms = buildings.geometry.values
+    nodata = dem.nodata if dem.nodata is not None else np.nan
+    min_heights = np.full(len(geoms), nodata, dtype="float64")
+    max_heights = np.full(len(geoms), nodata, dtype="float64")
+
+    bounds = shapely.bounds(geoms)
+    valid = ~np.isnan(bounds).any(axis=1)
+
+    # Pixel rows and cols of the upper left and lower right corner of each building
+    top_rows, left_cols = rowcol(dem.transform, bounds[valid, 0], bounds[valid, 3])
+    bottom_rows, right_cols = rowcol(dem.transform, bounds[valid, 2], bounds[valid, 1])
+    top_rows, left_cols = np.asarray(top_rows), np.asarray(left_cols)
+    bottom_rows, right_cols = np.asarray(bottom_rows), np.asarray(right_cols)
+    row_starts = np.clip(np.minimum(top_rows, bottom_rows), 0, dem.height)
+    row_stops = np.clip(np.maximum(top_rows, bottom_rows) + 1, 0, dem.height)
+    col_starts = np.clip(np.minimum(left_cols, right_cols), 0, dem.width)
+    col_stops = np.clip(np.maximum(left_cols, right_cols) + 1, 0, dem.width)
+
+    # Read only the part of the band covering the buildings, if it fits in memory
+    band = None
+    inside_dem = (row_starts < row_stops) & (col_starts < col_stops)
+    if inside_dem.any():
+        band_window = Window.from_slices(
+            (row_starts[inside_dem].min(), row_stops[inside_dem].max()),
+            (col_starts[inside_dem].min(), col_stops[inside_dem].max()),
+        )
+        if band_window.width * band_window.height <= max_in_memory_pixels:
+            band = dem.read(1, window=band_window)
+            band_row_off, band_col_off = band_window.row_off, band_window.col_off
+
+    # Visit buildings in raster order, so reads from the dataset walk the DEM's blocks
+    # sequentially instead of decompressing the same blocks repeatedly
+    order = np.lexsort((col_starts, row_starts))
+    for i, geom, row_start, row_stop, col_start, col_stop in zip(
+        np.flatnonzero(valid)[order],
+        geoms[valid][order],
+        row_starts[order],
+        row_stops[order],
+        col_starts[order],
+        col_stops[order],
+    ):
+        # Skip buildings outside the raster bounds
+        if row_start >= row_stop or col_start >= col_stop:
+            continue
+
+        window = Window.from_slices((row_start, row_stop), (col_start, col_stop))
+        if band is not None:
+            data = band[
+                row_start - band_row_off : row_stop - band_row_off,
+                col_start - band_col_off : col_stop - band_col_off,
+            ]
+        else:
+            data = dem.read(1, window=window)
+        inside = geometry_mask(
+            [geom],
+            out_shape=data.shape,
+            transform=window_transform(window, dem.transform),
+            all_touched=True,
+            invert=True,
+        )
+        values = data[inside]
+        if dem.nodata is not None:
+            values = values[values != dem.nodata]
+        if values.size == 0:
+            min_heights[i] = max_heights[i] = np.nan
+            continue
 
-    for geom in buildings.geometry:
-        # Mask the raster with the buildings, setting out of bounds pixels to NaN
-        try:
-            out_img, out_transform = mask(
-                dem, [geom], crop=True, all_touched=True, nodata=np.nan
-            )
-            # Calculate min and max heights, ignoring NaN values
-            min_height = np.nanmin(out_img)
-            max_height = np.nanmax(out_img)
-        except ValueError:  # In case building is out of raster bounds or empty
-            min_height = dem.nodata
-            max_height = dem.nodata
-        min_heights.append(min_height)
-        max_heights.append(max_height)
+        # Calculate min and max heights, ignoring NaN values
+        min_heights[i] = np.nanmin(values)
+        max_heights[i] = np.nanmax(values)
 
     return min_heights, max_heights
 
@@ -258,6 +567,10 @@ def sample_polys_with_buildings(
     """
     Sample a field's values from a polygon dataset for each building geometry.
 
+    Each building takes the value of the polygon it has the largest intersection area
+    with. Buildings that don't intersect a polygon, or whose polygon has no value, are
+    dropped.
+
     Parameters
     ----------
     polygons : gpd.GeoDataFrame
@@ -272,32 +585,192 @@ def sample_polys_with_buildings(
     gpd.GeoDataFrame
         Updated GeoDataFrame with sampled field values.
     """
-    buildings = buildings.reset_index()
+    building_geoms = buildings.geometry.values
+    polygon_geoms = polygons.geometry.values
 
-    # Perform a spatial join to associate land use polygons with building footprints
-    intersections = gpd.overlay(
-        buildings, polygons, how="intersection", keep_geom_type=False
+    # Find intersecting building and polygon pairs with a bulk spatial index query
+    building_idx, polygon_idx = polygons.sindex.query(
+        building_geoms, predicate="intersects"
+    )
+    intersections = gpd.GeoSeries(
+        shapely.intersection(building_geoms[building_idx], polygon_geoms[polygon_idx]),
+        crs=buildings.crs,
     )
-    intersections["intersection_area"] = intersections.to_crs(
-        {"proj": "cea"}
-    ).geometry.area
+    intersection_area = intersections.to_crs({"proj": "cea"}).area.to_numpy()
 
     # Identify the intersection with the maximum area for each building
-    max_intersections = intersections.loc[
-        intersections.groupby("index")["intersection_area"].idxmax()
-    ]
+    order = np.lexsort((-intersection_area, building_idx))
+    sampled_buildings, first = np.unique(building_idx[order], return_index=True)
+    sampled_polygons = polygon_idx[order][first]
 
-    # Assign the land use value back to the original buildings GeoDataFrame
-    buildings = buildings.merge(
-        max_intersections[["index", field]], on="index", how="left"
-    )
-    buildings = buildings.drop(columns=["index"])
+    # Assign the polygon value back to the buildings, dropping unsampled buildings
+    buildings = buildings.iloc[sampled_buildings].reset_index(drop=True)
+    buildings[field] = polygons[field].to_numpy()[sampled_polygons]
 
     buildings = buildings[buildings[field].notna()]
 
     return buildings
 
 
+def drop_spatial_index(session: Session, table_name: str, geom_col: str) -> None:
+    """
+    Drop the GiST spatial index on a geometry column, if it exists.
+
+    Used before bulk loads so the index isn't maintained row by row. The index name
+    follows the idx_<table>_<column> convention used by the migrations.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    table_name : str
+        Name of the table.
+    geom_col : str
+        Name of the indexed geometry column.
+
+    Returns
+    -------
+    None
+    """
+    session.execute(text(f"DROP INDEX IF EXISTS idx_{table_name}_{geom_col}"))
+
+
+def create_spatial_index(session: Session, table_name: str, geom_col: str) -> None:
+    """
+    Create a GiST spatial index on a geometry column, if it doesn't exist.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    table_name : str
+        Name of the table.
+    geom_col : str
+        Name of the geometry column to index.
+
+    Returns
+    -------
+    None
+    """
+    session.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{geom_col} "
+            f"ON {table_name} USING GIST ({geom_col})"
+        )
+    )
+
+
+def analyze_table(session: Session, table_name: str) -> None:
+    """
+    Update the query planner statistics for a table.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    table_name : str
+        Name of the table to analyze.
+
+    Returns
+    -------
+    None
+    """
+    session.execute(text(f"ANALYZE {table_name}"))
+
+
+def load_temp_table(
+    session: Session,
+    conn: Connection,
+    metadata: MetaData,
+    gdf: gpd.GeoDataFrame,
+    table_name: str,
+    **kwargs,
+) -> Table:
+    """
+    Load a GeoDataFrame into an unlogged temporary table.
+
+    The table is created with the column types GeoDataFrame.to_postgis would give the
+    full frame, but with an unindexed geometry column, and set as unlogged before any
+    rows are copied so the load isn't written to the WAL. The spatial index is built
+    once the rows are loaded, then the table is analyzed for the queries that join
+    against it. The btree index pandas creates on the index column is kept during the
+    load.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    conn : Connection
+        SQLAlchemy connection object.
+    metadata : MetaData
+        SQLAlchemy metadata to reflect the temporary table into.
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame to load.
+    table_name : str
+        Name of the temporary table, replaced if it exists.
+    **kwargs : dict
+        Additional arguments to pass to GeoDataFrame.to_postgis.
+
+    Returns
+    -------
+    Table
+        Reflected temporary table.
+    """
+    geom_col = gdf.geometry.name
+
+    # Geometry type as to_postgis infers it, a single type or GEOMETRY for mixed types
+    geom_types = gdf.geom_type.unique()
+    geometry_type = geom_types[0].upper() if len(geom_types) == 1 else "GEOMETRY"
+    if gdf.has_z.any():
+        geometry_type += "Z"
+
+    dtype = {
+        **kwargs.pop("dtype", {}),
+        geom_col: Geometry(
+            geometry_type=geometry_type, srid=gdf.crs.to_epsg(), spatial_index=False
+        ),
+    }
+    # Create the table from the full frame so pandas infers the same column types as
+    # to_postgis, without copying any rows
+    SQLDatabase(conn).prep_table(
+        gdf, table_name, if_exists="replace", schema="public", dtype=dtype, **kwargs
+    )
+    session.execute(text(f"ALTER TABLE {table_name} SET UNLOGGED"))
+
+    gdf.to_postgis(table_name, conn, schema="public", if_exists="append", **kwargs)
+
+    create_spatial_index(session, table_name, geom_col)
+    analyze_table(session, table_name)
+
+    return Table(table_name, metadata, autoload_with=conn)
+
+
+def remove_unmatched_gnaf_ids(
+    session: Session, table: Table, gnaf_id_col: str
+) -> Result:
+    """
+    Remove rows from a table whose GNAF ID doesn't match an address point.
+
+    Parameters
+    ----------
+    session : Session
+        SQLAlchemy session for database operations.
+    table : Table
+        SQLAlchemy table to remove rows from.
+    gnaf_id_col : str
+        Name of the table's GNAF ID column.
+
+    Returns
+    -------
+    Result
+        Result of the delete statement execution.
+    """
+    delete_stmt = delete(table).where(
+        ~exists().where(AddressPoint.gnaf_id == table.c[gnaf_id_col])
+    )
+    return session.execute(delete_stmt)
+
+
 def remove_overlapping_geoms(
     session: Session, overlap_threshold: float, bbox: tuple = None
 ) -> Result:
@@ -424,18 +897,14 @@ def split_by_cadastre(
 
     # Update the original GeoDataFrame
     buildings.loc[buildings_to_split.index, "geometry"] = None
-    buildings = gpd.GeoDataFrame(
-        pd.concat([buildings.geometry, split_buildings.geometry], ignore_index=True),
-        crs=buildings.crs,
-    )
-    buildings = buildings.explode()
-    buildings = buildings.reset_index(drop=True)
+    geoms = np.concatenate([buildings.geometry.values, split_buildings.geometry.values])
+    buildings = gpd.GeoDataFrame(geometry=shapely.get_parts(geoms), crs=buildings.crs)
 
     return buildings
 
 
 def flatten_cadastre_geoms(
-    session: Session, conn: Connection, Base: DeclarativeMeta, temp_cadastre: Table
+    session: Session, conn: Connection, metadata: MetaData, temp_cadastre: Table
 ) -> Table:
     """
     Flatten cadastre geometries by polygonising overlaps.
@@ -449,8 +918,8 @@ def flatten_cadastre_geoms(
         SQLAlchemy session for database operations.
     conn : Connection
         SQLAlchemy connection object.
-    Base : DeclarativeMeta
-        SQLAlchemy declarative base for ORM models.
+    metadata : MetaData
+        SQLAlchemy metadata the temporary cadastre table is reflected into.
     temp_cadastre : Table
         Temporary table containing cadastre geometries.
 
@@ -477,12 +946,16 @@ def flatten_cadastre_geoms(
         ),
     )
 
-    # Create a temporary table to insert the select query into
+    # Create an unlogged temporary table to insert the select query into
     flat_temp_cadastre = Table(
         "flat_temp_cadastre",
-        Base.metadata,
+        metadata,
         Column("id", Integer, primary_key=True),
-        Column("geometry", Geometry(geometry_type="POLYGON", srid=7844)),
+        Column(
+            "geometry",
+            Geometry(geometry_type="POLYGON", srid=7844, spatial_index=False),
+        ),
+        prefixes=["UNLOGGED"],
     )
     flat_temp_cadastre.create(conn)
 
@@ -492,9 +965,11 @@ def flatten_cadastre_geoms(
     temp_cadastre.drop(conn)  # Drop the original temp_cadastre table
     # Rename the flat_temp_cadastre table
     session.execute(text("ALTER TABLE flat_temp_cadastre RENAME TO temp_cadastre"))
+    create_spatial_index(session, "temp_cadastre", "geometry")
+    analyze_table(session, "temp_cadastre")
 
     # Return flat cadastre metadata for subsequent joining
-    return Table("temp_cadastre", Base.metadata, autoload_with=conn)
+    return Table("temp_cadastre", metadata, autoload_with=conn)
 
 
 def join_by_contains(
@@ -712,7 +1187,9 @@ def build_address_match_query(
     return select_query
 
 
-def insert_address_building_association(session: Session, select_query: Select):
+def insert_address_building_association(
+    session: Session, select_query: Select | CompoundSelect
+):
     """
     Insert records into the address_point_building_association table from a select query.
 
@@ -720,8 +1197,9 @@ def insert_address_building_association(session: Session, select_query: Select):
     ----------
     session : Session
         SQLAlchemy session for database operations.
-    select_query : Select
-        SQLAlchemy select query to retrieve address point and building associations.
+    select_query : Select or CompoundSelect
+        SQLAlchemy select query, or union of select queries, to retrieve address point
+        and building associations.
 
     Returns
     -------
@@ -964,10 +1442,15 @@ def build_floor_measure_query(
     return select_query
 
 
-def insert_floor_measure(session: Session, select_query: Select) -> list:
+def insert_floor_measure(
+    session: Session, select_query: Select, dataset_id: uuid.UUID
+) -> int:
     """
-    Insert records into the FloorMeasure table from a select query, returning a list of
-    the floor_measure ids that were inserted.
+    Insert records into the FloorMeasure table from a select query, associating the
+    inserted records with a Dataset record and returning the number inserted.
+
+    Both inserts run server side in a single statement, the floor_measure insert is a
+    data-modifying CTE whose returned ids feed the association insert.
 
     Parameters
     ----------
@@ -975,13 +1458,15 @@ def insert_floor_measure(session: Session, select_query: Select) -> list:
         SQLAlchemy session for database operations.
     select_query : Select
         SQLAlchemy select query to retrieve floor measure data.
+    dataset_id : uuid.UUID
+        ID of the dataset to associate the inserted floor measures with.
 
     Returns
     -------
-    list
-        List of inserted floor measure IDs.
+    int
+        Number of inserted floor measures.
     """
-    ids = session.execute(
+    inserted_floor_measure = (
         insert(FloorMeasure)
         .from_select(
             [
@@ -998,8 +1483,20 @@ def insert_floor_measure(session: Session, select_query: Select) -> list:
         )
         .on_conflict_do_nothing()
         .returning(FloorMeasure.id)
+        .cte("inserted_floor_measure")
+    )
+    result = session.execute(
+        insert(floor_measure_dataset_association)
+        .from_select(
+            ["floor_measure_id", "dataset_id"],
+            select(
+                inserted_floor_measure.c.id,
+                literal(dataset_id, UUID(as_uuid=True)),
+            ),
+        )
+        .add_cte(inserted_floor_measure)
     )
-    return list(ids.all())
+    return result.rowcount
 
 
 def insert_floor_measure_dataset_association(